@@ -182,19 +182,19 @@ def get_language_configs() -> list[LicenseLanguageConfig]:
     ]
 
     cmake_specific_files.extend(find_files_by_name(Directories.logenium_tests, "CMakeLists.txt"))
-    cmake_specific_files.extend(find_files_by_extensions(Directories.logenium_cmake, [".cmake"]))
+    cmake_specific_files.extend(find_files_by_extensions(Directories.logenium_cmake, (".cmake",)))
 
     cmake_specific_files.extend(find_files_by_name(Directories.xheader_tests, "CMakeLists.txt"))
-    cmake_specific_files.extend(find_files_by_extensions(Directories.xheader_cmake, [".cmake"]))
+    cmake_specific_files.extend(find_files_by_extensions(Directories.xheader_cmake, (".cmake",)))
 
     cmake_specific_files.extend(find_files_by_name(Directories.debug_tests, "CMakeLists.txt"))
-    cmake_specific_files.extend(find_files_by_extensions(Directories.debug_cmake, [".cmake"]))
+    cmake_specific_files.extend(find_files_by_extensions(Directories.debug_cmake, (".cmake",)))
 
     cmake_specific_files.extend(find_files_by_name(Directories.corelib_tests, "CMakeLists.txt"))
-    cmake_specific_files.extend(find_files_by_extensions(Directories.corelib_cmake, [".cmake"]))
+    cmake_specific_files.extend(find_files_by_extensions(Directories.corelib_cmake, (".cmake",)))
 
     cmake_specific_files.extend(find_files_by_name(Directories.logging_tests, "CMakeLists.txt"))
-    cmake_specific_files.extend(find_files_by_extensions(Directories.logging_cmake, [".cmake"]))
+    cmake_specific_files.extend(find_files_by_extensions(Directories.logging_cmake, (".cmake",)))
 
     return [
         LicenseLanguageConfig(
@@ -282,36 +282,39 @@ class LicenseHeaderStatistics(Statistics):
             self.issues += 1
             if issue_type == IssueType.MISSING:
                 self.missing += 1
+                self._has_failures = True
             elif issue_type == IssueType.INCORRECT:
                 self.incorrect += 1
+                self._has_failures = True
         elif result.status == FileStatus.ERROR:
             self.errors += 1
+            self._has_failures = True
 
     def print_summary(self, mode: str) -> None:
-        typer.echo("")
-        typer.echo(typer.style("=" * 60, fg="cyan"))
-        typer.echo(typer.style(f"Summary ({mode} mode)", fg="cyan", bold=True))
-        typer.echo(typer.style("=" * 60, fg="cyan"))
-        typer.echo(f"Total files checked: {self.total}")
+        lines = [
+            "",
+            self.separator,
+            typer.style(f"Summary ({mode} mode)", fg="cyan", bold=True),
+            self.separator,
+            f"Total files checked: {self.total}",
+        ]
 
         if mode == "check":
-            typer.echo(f"  {typer.style('[OK]', fg='green')}        {self.ok}")
+            lines.append(f"  {self.ok_tag}        {self.ok}")
             if self.missing > 0:
-                typer.echo(f"  {typer.style('[MISSING]', fg='red')}   {self.missing}")
+                lines.append(f"  {typer.style('[MISSING]', fg='red')}   {self.missing}")
             if self.incorrect > 0:
-                typer.echo(f"  {typer.style('[INCORRECT]', fg='red')} {self.incorrect}")
+                lines.append(f"  {typer.style('[INCORRECT]', fg='red')} {self.incorrect}")
             if self.errors > 0:
-                typer.echo(f"  {typer.style('[ERROR]', fg='yellow')}     {self.errors}")
+                lines.append(f"  {self.yellow_error_tag}     {self.errors}")
         elif mode == "fix":
-            typer.echo(f"  {typer.style('[FIXED]', fg='green')}    {self.fixed}")
-            typer.echo(f"  {typer.style('[SKIPPED]', fg='cyan')}   {self.skipped}")
+            lines.append(f"  {self.fixed_tag}    {self.fixed}")
+            lines.append(f"  {self.skipped_tag}   {self.skipped}")
             if self.errors > 0:
-                typer.echo(f"  {typer.style('[ERROR]', fg='yellow')}     {self.errors}")
+                lines.append(f"  {self.yellow_error_tag}     {self.errors}")
 
-        typer.echo(typer.style("=" * 60, fg="cyan"))
-
-    def has_failures(self) -> bool:
-        return self.missing > 0 or self.incorrect > 0 or self.errors > 0
+        lines.append(self.separator)
+        typer.echo("\n".join(lines))
 
 
 @dataclass
@@ -633,7 +636,7 @@ def check(no_cache: bool = typer.Option(False, "--no-cache", help="Disable cachi
 
     stats.print_summary("check")
 
-    if stats.has_failures():
+    if stats.has_failures:
         typer.echo(
             typer.style(
                 "\nSome files are missing or have incorrect license headers.",
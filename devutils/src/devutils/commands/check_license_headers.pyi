@@ -82,7 +82,6 @@ class LicenseHeaderStatistics(Statistics):
     def __init__(self) -> None: ...
     def record_result(self, result: FileResult, issue_type: IssueType | None = None) -> None: ...
     def print_summary(self, mode: str) -> None: ...
-    def has_failures(self) -> bool: ...
 
 @dataclass
 class HeaderCheckResult:
@@ -87,7 +87,7 @@ def build_single_project(
 
         if ci:
             docs_dir = config_path.parent / "docs"
-            temp_files = find_files_by_extensions(docs_dir, [".map", ".md5"])
+            temp_files = find_files_by_extensions(docs_dir, (".map", ".md5"))
             for file in temp_files:
                 with output_lock:
                     print_with_prefix(f"Removing {file}...", "cyan", bold=True)
@@ -111,7 +111,7 @@ def build(ci: bool = typer.Option(False, "--ci", help="Ci mode, removes unnecess
     if not check_doxygen_is_available():
         sys.exit(1)
 
-    for _project_name, config_path in DOXYGEN_CONFIGS.items():
+    for _project_name, config_path in DOXYGEN_CONFIGS:
         if not config_path.exists():
             typer.echo(typer.style(f"Error: Doxygen config file {config_path} does not exist.", fg="red", bold=True))
             sys.exit(1)
@@ -126,7 +126,7 @@ def build(ci: bool = typer.Option(False, "--ci", help="Ci mode, removes unnecess
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_project = {}
-        for project_name, config_path in DOXYGEN_CONFIGS.items():
+        for project_name, config_path in DOXYGEN_CONFIGS:
             future = executor.submit(
                 build_single_project,
                 project_name,
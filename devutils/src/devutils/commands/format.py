@@ -319,7 +319,7 @@ def check() -> None:
 
     stats.print_summary("check")
 
-    if stats.has_failures():
+    if stats.has_failures:
         typer.echo(
             typer.style(
                 "\nSome files are not formatted correctly.",
@@ -1,13 +1,16 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+import functools
+import hashlib
 import os
 import pathlib
+import re
 import subprocess
 import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypedDict
 
 import typer
@@ -21,36 +24,73 @@ from devutils.utils.file_checking import (
     LanguageConfig,
     Statistics,
     format_file_path,
+    format_file_paths,
     print_status,
 )
 
 lint: typer.Typer = typer.Typer()
 
+CACHE_VERSION = "2.0"
+CACHE_SHARD_COUNT = 16
+CACHE_AUTOSAVE_INTERVAL = 10.0
+LINT_OUTPUT_LIMIT: int = 65536
+LINT_PACKAGE_OUTPUT_LIMIT: int = 4 * 1024 * 1024
+LINT_OUTPUT_TRUNCATED: bytes = b"\n...[output truncated]"
+LINT_SCAN_OVERLAP: int = 16
+LINT_ERROR_PATTERN: re.Pattern[bytes] = re.compile(rb"error:|traceback|assertion", re.IGNORECASE)
+LINT_WARNING_PATTERN: re.Pattern[bytes] = re.compile(rb"warning:|note:", re.IGNORECASE)
+LINT_CRASH_PATTERN: re.Pattern[bytes] = re.compile(rb"traceback|assertion", re.IGNORECASE)
 
-class CacheEntry(TypedDict):
-    mtime: float
-    status: str
-    error: str | None
+
+CacheKey = tuple[str, str, str]
+CacheEntry = tuple[float, str, str | None]
 
 
 class CacheData(TypedDict):
     version: str
-    cache: dict[str, CacheEntry]
+    config_hash: str
+    keys: list[list[str]]
+    mtimes: list[float]
+    statuses: list[str]
+    errors: list[str | None]
+
+
+def get_config_hash() -> str:
+    digest = hashlib.sha256()
+    for config_file in (Files.devutils_pyproject_toml, Files.clang_tidy_config, Files.compile_commands):
+        try:
+            digest.update(config_file.read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 class LintCacheManager:
     cache_path: pathlib.Path
     enabled: bool
-    cache_data: CacheData
+    config_hash: str
+    cache_shards: list[tuple[dict[CacheKey, CacheEntry], threading.Lock]]
     lock: threading.Lock
     package_level_results: dict[str, dict[pathlib.Path, FileResult]]
+    fix_lock: threading.Lock
+    package_level_fixes: dict[str, bool]
+    save_lock: threading.Lock
+    autosave_stop: threading.Event
+    autosave_thread: threading.Thread | None
 
     def __init__(self, cache_path: pathlib.Path, enabled: bool = True):
         self.cache_path = cache_path
         self.enabled = enabled
-        self.cache_data: CacheData = {"version": "1.0", "cache": {}}
+        self.config_hash = get_config_hash() if enabled else ""
+        self.cache_shards = [({}, threading.Lock()) for _ in range(CACHE_SHARD_COUNT)]
         self.lock = threading.Lock()
         self.package_level_results = {}
+        self.fix_lock = threading.Lock()
+        self.package_level_fixes = {}
+        self.save_lock = threading.Lock()
+        self.autosave_stop = threading.Event()
+        self.autosave_thread = None
 
         if self.enabled:
             self.load_cache()
@@ -62,51 +102,120 @@ class LintCacheManager:
         try:
             with open(self.cache_path) as f:
                 data: object = yaml.safe_load(f)
-                if isinstance(data, dict):
-                    version = data.get("version")
-                    if isinstance(version, str) and version == "1.0":
-                        if "cache" in data and isinstance(data["cache"], dict):
-                            self.cache_data = data  # type: ignore[assignment]
         except (yaml.YAMLError, OSError):
-            pass
+            return
+
+        if not isinstance(data, dict):
+            return
+
+        version = data.get("version")
+        config_hash = data.get("config_hash")
+        if not isinstance(version, str) or version != CACHE_VERSION or not isinstance(config_hash, str):
+            return
+        if config_hash != self.config_hash:
+            return
+
+        cache_data: CacheData = data  # type: ignore[assignment]
+        try:
+            for key, mtime, status, error in zip(
+                cache_data["keys"], cache_data["mtimes"], cache_data["statuses"], cache_data["errors"], strict=True
+            ):
+                language, tool_name, rel_path = key
+                cache_key = (language, tool_name, rel_path)
+                self.get_cache_shard(cache_key)[0][cache_key] = (mtime, status, error)
+        except (KeyError, TypeError, ValueError):
+            for shard_entries, _ in self.cache_shards:
+                shard_entries.clear()
 
     def save_cache(self) -> None:
         if not self.enabled:
             return
 
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.save_lock:
+            for _, shard_lock in self.cache_shards:
+                shard_lock.acquire()
+            try:
+                cache_data: CacheData = {
+                    "version": CACHE_VERSION,
+                    "config_hash": self.config_hash,
+                    "keys": [],
+                    "mtimes": [],
+                    "statuses": [],
+                    "errors": [],
+                }
+                for shard_entries, _ in self.cache_shards:
+                    for cache_key, (mtime, status, error) in shard_entries.items():
+                        cache_data["keys"].append(list(cache_key))
+                        cache_data["mtimes"].append(mtime)
+                        cache_data["statuses"].append(status)
+                        cache_data["errors"].append(error)
+            finally:
+                for _, shard_lock in self.cache_shards:
+                    shard_lock.release()
+
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            temp_path = self.cache_path.with_suffix(".tmp")
+            try:
+                with open(temp_path, "w") as f:
+                    yaml.dump(cache_data, f, default_flow_style=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                temp_path.replace(self.cache_path)
+            except OSError:
+                if temp_path.exists():
+                    temp_path.unlink()
+
+    def start_autosave(self) -> None:
+        if not self.enabled or self.autosave_thread is not None:
+            return
 
-        temp_path = self.cache_path.with_suffix(".tmp")
-        try:
-            with open(temp_path, "w") as f:
-                yaml.dump(self.cache_data, f, default_flow_style=False)
-            temp_path.replace(self.cache_path)
-        except OSError:
-            if temp_path.exists():
-                temp_path.unlink()
+        self.autosave_stop.clear()
+        self.autosave_thread = threading.Thread(target=self.autosave_loop, daemon=True)
+        self.autosave_thread.start()
 
-    def get_cache_key(self, language: str, tool_name: str, file_path: pathlib.Path) -> str:
-        rel_path = format_file_path(file_path)
-        return f"{language}:{tool_name}:{rel_path}"
+    def autosave_loop(self) -> None:
+        while not self.autosave_stop.wait(CACHE_AUTOSAVE_INTERVAL):
+            self.save_cache()
 
-    def get_cached_result(self, language: str, tool_name: str, file_path: pathlib.Path) -> FileResult | None:
+    def stop_autosave(self) -> None:
+        if self.autosave_thread is None:
+            return
+
+        self.autosave_stop.set()
+        self.autosave_thread.join()
+        self.autosave_thread = None
+
+    def get_cache_key(self, language: str, tool_name: str, file_path: pathlib.Path) -> CacheKey:
+        return (language, tool_name, format_file_path(file_path))
+
+    def get_cache_shard_index(self, cache_key: CacheKey) -> int:
+        return hash(cache_key) & (CACHE_SHARD_COUNT - 1)
+
+    def get_cache_shard(self, cache_key: CacheKey) -> tuple[dict[CacheKey, CacheEntry], threading.Lock]:
+        return self.cache_shards[self.get_cache_shard_index(cache_key)]
+
+    def get_cached_result(
+        self, language: str, tool_name: str, file_path: pathlib.Path, current_mtime: float | None = None
+    ) -> FileResult | None:
         if not self.enabled:
             return None
 
         cache_key = self.get_cache_key(language, tool_name, file_path)
-
-        with self.lock:
-            entry = self.cache_data["cache"].get(cache_key)
+        entry = self.get_cache_shard(cache_key)[0].get(cache_key)
 
         if not entry:
             return None
 
-        try:
-            current_mtime = file_path.stat().st_mtime
-        except OSError:
-            return None
+        mtime, cached_status, error = entry
+
+        if current_mtime is None:
+            try:
+                current_mtime = file_path.stat().st_mtime
+            except OSError:
+                return None
 
-        if entry["mtime"] != current_mtime:
+        if mtime != current_mtime:
             return None
 
         status_map = {
@@ -115,30 +224,44 @@ class LintCacheManager:
             "issue": FileStatus.ISSUE,
             "error": FileStatus.ERROR,
         }
-        status = status_map.get(entry["status"], FileStatus.ERROR)
-        return FileResult(file_path, status, entry.get("error"))
+        status = status_map.get(cached_status, FileStatus.ERROR)
+        return FileResult(file_path, status, error)
 
-    def update_cache(self, language: str, tool_name: str, file_path: pathlib.Path, result: FileResult) -> None:
+    def is_cached_ok(self, language: str, tool_names: list[str], file_path: pathlib.Path, current_mtime: float) -> bool:
         if not self.enabled:
-            return
+            return False
 
-        cache_key = self.get_cache_key(language, tool_name, file_path)
+        for tool_name in tool_names:
+            cache_key = self.get_cache_key(language, tool_name, file_path)
+            entry = self.get_cache_shard(cache_key)[0].get(cache_key)
+            if not entry or entry[0] != current_mtime or entry[1] != "ok":
+                return False
 
-        try:
-            mtime = file_path.stat().st_mtime
-        except OSError:
-            return
+        return True
 
+    def make_cache_update(
+        self, language: str, tool_name: str, file_path: pathlib.Path, mtime: float, result: FileResult
+    ) -> tuple[CacheKey, CacheEntry]:
         status_map = {
             FileStatus.OK: "ok",
             FileStatus.WARNING: "warning",
             FileStatus.ISSUE: "issue",
             FileStatus.ERROR: "error",
         }
-        entry: CacheEntry = {"mtime": mtime, "status": status_map[result.status], "error": result.error}
+        return self.get_cache_key(language, tool_name, file_path), (mtime, status_map[result.status], result.error)
 
-        with self.lock:
-            self.cache_data["cache"][cache_key] = entry
+    def update_cache_bulk(self, updates: list[tuple[CacheKey, CacheEntry]]) -> None:
+        if not self.enabled or not updates:
+            return
+
+        updates_by_shard: dict[int, list[tuple[CacheKey, CacheEntry]]] = {}
+        for cache_key, entry in updates:
+            updates_by_shard.setdefault(self.get_cache_shard_index(cache_key), []).append((cache_key, entry))
+
+        for shard_index, shard_updates in updates_by_shard.items():
+            shard_entries, shard_lock = self.cache_shards[shard_index]
+            with shard_lock:
+                shard_entries.update(shard_updates)
 
     def get_package_result(self, cache_key: str, file_path: pathlib.Path) -> FileResult | None:
         with self.lock:
@@ -159,6 +282,13 @@ class LintStep:
     fix_args: list[str]
     can_fix: bool = True
     package_level: bool = False
+    check_argv_prefix: list[str] = field(init=False)
+    fix_argv_prefix: list[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        runner = ["uv", "run"] if self.tool_name in ["mypy", "ruff"] else []
+        self.check_argv_prefix = runner + [self.tool_name] + self.check_args
+        self.fix_argv_prefix = runner + [self.tool_name] + self.fix_args
 
 
 @dataclass
@@ -244,6 +374,7 @@ def get_language_configs() -> list[LintLanguageConfig]:
     ]
 
 
+@functools.cache  # type: ignore[misc]
 def check_tool_available(tool_name: str) -> bool:
     try:
         if tool_name in ["mypy", "ruff"]:
@@ -265,6 +396,44 @@ def check_tool_available(tool_name: str) -> bool:
         return False
 
 
+@dataclass
+class CappedOutput:
+    returncode: int
+    output: bytes
+    truncated: bool = False
+    has_error: bool = False
+    has_warning: bool = False
+    has_crash: bool = False
+
+    def scan(self, chunk: bytes) -> None:
+        self.has_error = self.has_error or LINT_ERROR_PATTERN.search(chunk) is not None
+        self.has_warning = self.has_warning or LINT_WARNING_PATTERN.search(chunk) is not None
+        self.has_crash = self.has_crash or LINT_CRASH_PATTERN.search(chunk) is not None
+
+
+def run_capped(cmd: list[str], limit: int) -> CappedOutput:
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as process:
+        if process.stdout is None:
+            return CappedOutput(process.wait(), b"")
+
+        result = CappedOutput(0, process.stdout.read(limit))
+        result.scan(result.output)
+        tail = result.output[-LINT_SCAN_OVERLAP:]
+        while chunk := process.stdout.read(limit):
+            result.truncated = True
+            result.scan(tail + chunk)
+            tail = chunk[-LINT_SCAN_OVERLAP:]
+        result.returncode = process.wait()
+
+    if result.truncated:
+        result.output += LINT_OUTPUT_TRUNCATED
+    return result
+
+
+def decode_output(output: bytes) -> str:
+    return output.strip().decode("utf-8", errors="replace")
+
+
 def run_package_level_lint(
     files: list[pathlib.Path],
     lint_step: LintStep,
@@ -277,46 +446,36 @@ def run_package_level_lint(
         return
 
     try:
-        if lint_step.tool_name in ["mypy", "ruff"]:
-            cmd = ["uv", "run", lint_step.tool_name] + lint_step.check_args
-        else:
-            cmd = [lint_step.tool_name] + lint_step.check_args
+        lint_output = run_capped(lint_step.check_argv_prefix, LINT_PACKAGE_OUTPUT_LIMIT)
+        returncode = lint_output.returncode
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        output = result.stdout + result.stderr
-        output_lower = output.lower()
+        output = lint_output.output.decode("utf-8", errors="replace")
+        output_has_crash = lint_output.has_crash
+        lines = output.split("\n")
 
         file_results: dict[pathlib.Path, FileResult] = {}
 
-        for file_path in files:
-            file_path_str = format_file_path(file_path)
+        for file_path, file_path_str in zip(files, format_file_paths(files), strict=True):
             file_path_normalized = file_path_str.replace("\\", "/")
             output_has_file_mention = file_path_str in output or file_path_normalized in output
 
-            if result.returncode == 0:
+            if returncode == 0:
                 file_results[file_path] = FileResult(file_path, FileStatus.OK)
             else:
                 if output_has_file_mention:
-                    lines = output.split("\n")
                     file_lines = [line for line in lines if file_path_str in line or file_path_normalized in line]
                     relevant_output = "\n".join(file_lines)
 
-                    if (
-                        "error:" in relevant_output.lower()
-                        or "traceback" in output_lower
-                        or "assertion" in output_lower
-                    ):
+                    if "error:" in relevant_output.lower() or output_has_crash:
                         file_results[file_path] = FileResult(file_path, FileStatus.ERROR, relevant_output)
                     elif "warning:" in relevant_output.lower() or "note:" in relevant_output.lower():
                         file_results[file_path] = FileResult(file_path, FileStatus.WARNING, relevant_output)
                     else:
                         file_results[file_path] = FileResult(file_path, FileStatus.ISSUE, relevant_output)
+                elif lint_output.truncated:
+                    file_results[file_path] = FileResult(
+                        file_path, FileStatus.ERROR, "Package-level lint output truncated before this file was reported"
+                    )
                 else:
                     file_results[file_path] = FileResult(file_path, FileStatus.OK)
 
@@ -330,8 +489,13 @@ def run_package_level_lint(
             )
 
 
+def is_cacheable_result(lint_step: LintStep, result: FileResult) -> bool:
+    return not (lint_step.package_level and result.status == FileStatus.ERROR)
+
+
 def check_file_lint(
     file_path: pathlib.Path,
+    file_path_str: str,
     lint_step: LintStep,
     config_name: str,
     cache_manager: LintCacheManager,
@@ -345,50 +509,32 @@ def check_file_lint(
             return FileResult(file_path, FileStatus.ERROR, "Package-level linting not run")
 
     try:
-        if lint_step.tool_name in ["mypy", "ruff"]:
-            cmd = ["uv", "run", lint_step.tool_name] + lint_step.check_args + [str(file_path)]
-        else:
-            cmd = [lint_step.tool_name] + lint_step.check_args + [str(file_path)]
+        lint_output = run_capped(lint_step.check_argv_prefix + [file_path_str], LINT_OUTPUT_LIMIT)
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        output = result.stdout + result.stderr
-        output_lower = output.lower()
-
-        if result.returncode == 0:
-            if "warning:" in output_lower or "note:" in output_lower:
-                return FileResult(file_path, FileStatus.WARNING, output.strip())
+        if lint_output.returncode == 0:
+            if lint_output.has_warning:
+                return FileResult(file_path, FileStatus.WARNING, decode_output(lint_output.output))
             else:
                 return FileResult(file_path, FileStatus.OK)
         else:
-            if "error:" in output_lower or "traceback" in output_lower or "assertion" in output_lower:
-                return FileResult(file_path, FileStatus.ERROR, output.strip())
-            elif "warning:" in output_lower or "note:" in output_lower:
-                return FileResult(file_path, FileStatus.WARNING, output.strip())
+            if lint_output.has_error:
+                return FileResult(file_path, FileStatus.ERROR, decode_output(lint_output.output))
+            elif lint_output.has_warning:
+                return FileResult(file_path, FileStatus.WARNING, decode_output(lint_output.output))
             else:
-                return FileResult(file_path, FileStatus.ISSUE, output.strip())
+                return FileResult(file_path, FileStatus.ISSUE, decode_output(lint_output.output))
 
     except Exception as e:
         return FileResult(file_path, FileStatus.ERROR, str(e))
 
 
-def fix_file_lint(file_path: pathlib.Path, lint_step: LintStep) -> bool:
+def fix_file_lint(file_path_str: str, lint_step: LintStep) -> bool:
     try:
         if not lint_step.can_fix:
             return False
 
-        if lint_step.tool_name in ["mypy", "ruff"]:
-            cmd = ["uv", "run", lint_step.tool_name] + lint_step.fix_args + [str(file_path)]
-        else:
-            cmd = [lint_step.tool_name] + lint_step.fix_args + [str(file_path)]
-
         result = subprocess.run(
-            cmd,
+            lint_step.fix_argv_prefix + [file_path_str],
             capture_output=True,
             text=True,
             check=False,
@@ -400,28 +546,110 @@ def fix_file_lint(file_path: pathlib.Path, lint_step: LintStep) -> bool:
         return False
 
 
+def fast_path_all_cached(
+    files: list[pathlib.Path],
+    config: LintLanguageConfig,
+    cache_manager: LintCacheManager,
+) -> tuple[list[pathlib.Path], list[pathlib.Path], dict[pathlib.Path, os.stat_result]]:
+    tool_names = [lint_step.tool_name for lint_step in config.lint_steps]
+    cached_files: list[pathlib.Path] = []
+    pending_files: list[pathlib.Path] = []
+    file_stats: dict[pathlib.Path, os.stat_result] = {}
+
+    for file_path in files:
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            pending_files.append(file_path)
+            continue
+
+        file_stats[file_path] = file_stat
+        if cache_manager.is_cached_ok(config.name, tool_names, file_path, file_stat.st_mtime):
+            cached_files.append(file_path)
+        else:
+            pending_files.append(file_path)
+
+    if cached_files:
+        if pending_files:
+            typer.echo(typer.style(f"{len(cached_files)} files cached OK", fg="green"))
+        else:
+            typer.echo(typer.style(f"All {len(cached_files)} files cached OK", fg="green"))
+
+    return cached_files, pending_files, file_stats
+
+
+def get_mtime(file_stats: dict[pathlib.Path, os.stat_result], file_path: pathlib.Path) -> float | None:
+    file_stat = file_stats.get(file_path)
+    return file_stat.st_mtime if file_stat is not None else None
+
+
+def sort_by_size_descending(
+    files: list[pathlib.Path], file_stats: dict[pathlib.Path, os.stat_result]
+) -> list[pathlib.Path]:
+    def file_size(file_path: pathlib.Path) -> int:
+        file_stat = file_stats.get(file_path)
+        return file_stat.st_size if file_stat is not None else 0
+
+    return sorted(files, key=file_size, reverse=True)
+
+
+def run_package_level_fix(lint_step: LintStep, config_name: str, cache_manager: LintCacheManager) -> bool:
+    cache_key = f"{config_name}:{lint_step.tool_name}"
+
+    with cache_manager.fix_lock:
+        fixed = cache_manager.package_level_fixes.get(cache_key)
+        if fixed is not None:
+            return fixed
+
+        try:
+            result = subprocess.run(
+                lint_step.fix_argv_prefix,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+
+            fixed = result.returncode == 0
+
+        except Exception:
+            fixed = False
+
+        cache_manager.package_level_fixes[cache_key] = fixed
+        return fixed
+
+
 def check_single_file(
     file_path: pathlib.Path,
     config: LintLanguageConfig,
     cache_manager: LintCacheManager,
     output_lock: threading.Lock,
-) -> tuple[FileStatus, list[str]]:
+    mtime: float | None,
+) -> tuple[FileStatus, list[str], list[tuple[CacheKey, CacheEntry]]]:
     file_has_warnings = False
     file_has_issues = False
     file_has_errors = False
     error_messages = []
     cached_count = 0
+    cache_updates: list[tuple[CacheKey, CacheEntry]] = []
+    file_path_str = str(file_path)
 
     for lint_step in config.lint_steps:
-        cached_result = cache_manager.get_cached_result(config.name, lint_step.tool_name, file_path)
+        cached_result = (
+            cache_manager.get_cached_result(config.name, lint_step.tool_name, file_path, mtime)
+            if mtime is not None
+            else None
+        )
 
         if cached_result:
             result = cached_result
             cached_count += 1
         else:
-            result = check_file_lint(file_path, lint_step, config.name, cache_manager)
+            result = check_file_lint(file_path, file_path_str, lint_step, config.name, cache_manager)
 
-            cache_manager.update_cache(config.name, lint_step.tool_name, file_path, result)
+            if mtime is not None and cache_manager.enabled and is_cacheable_result(lint_step, result):
+                cache_updates.append(
+                    cache_manager.make_cache_update(config.name, lint_step.tool_name, file_path, mtime, result)
+                )
 
         if result.status == FileStatus.WARNING:
             file_has_warnings = True
@@ -470,7 +698,7 @@ def check_single_file(
             tag = "[CACHED:OK]" if is_cached else "[OK]"
             print_status(tag, "green", file_path)
 
-    return final_status, error_messages
+    return final_status, error_messages, cache_updates
 
 
 def check_files_parallel(
@@ -479,31 +707,47 @@ def check_files_parallel(
     stats: Statistics,
     cache_manager: LintCacheManager,
 ) -> None:
+    cached_files, files, file_stats = fast_path_all_cached(files, config, cache_manager)
+    for file_path in cached_files:
+        stats.record_result(FileResult(file_path, FileStatus.OK))
+
+    if not files:
+        return
+
+    files = sort_by_size_descending(files, file_stats)
+
     for lint_step in config.lint_steps:
         if lint_step.package_level:
             run_package_level_lint(files, lint_step, config.name, cache_manager)
 
     output_lock = threading.Lock()
 
-    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(files))) as executor:
         future_to_file = {
-            executor.submit(check_single_file, file_path, config, cache_manager, output_lock): file_path
+            executor.submit(
+                check_single_file, file_path, config, cache_manager, output_lock, get_mtime(file_stats, file_path)
+            ): file_path
             for file_path in files
         }
 
-        for future in as_completed(future_to_file):
-            file_path = future_to_file[future]
-            try:
-                final_status, error_messages = future.result()
-
-                result = FileResult(file_path, final_status, "\n".join(error_messages) if error_messages else None)
-                stats.record_result_threadsafe(result)
-
-            except Exception as e:
-                with output_lock:
-                    print_status("[ERROR]", "yellow", file_path, str(e))
-                stats.increment_total_threadsafe()
-                stats.increment_errors_threadsafe()
+        try:
+            for future in as_completed(future_to_file):
+                file_path = future_to_file[future]
+                try:
+                    final_status, error_messages, cache_updates = future.result()
+                    cache_manager.update_cache_bulk(cache_updates)
+
+                    result = FileResult(file_path, final_status, "\n".join(error_messages) if error_messages else None)
+                    stats.record_result_threadsafe(result)
+
+                except Exception as e:
+                    with output_lock:
+                        print_status("[ERROR]", "yellow", file_path, str(e))
+                    stats.increment_total_threadsafe()
+                    stats.increment_errors_threadsafe()
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
 
 def fix_single_file(
@@ -511,22 +755,33 @@ def fix_single_file(
     config: LintLanguageConfig,
     cache_manager: LintCacheManager,
     output_lock: threading.Lock,
+    mtime: float | None,
 ) -> tuple[str, list[str]]:
     file_had_issues = False
     all_fixed = True
     file_has_errors = False
     error_messages = []
     cached_count = 0
+    cache_updates: list[tuple[CacheKey, CacheEntry]] = []
+    file_path_str = str(file_path)
 
     for lint_step in config.lint_steps:
-        cached_result = cache_manager.get_cached_result(config.name, lint_step.tool_name, file_path)
+        cached_result = (
+            cache_manager.get_cached_result(config.name, lint_step.tool_name, file_path, mtime)
+            if mtime is not None
+            else None
+        )
 
         if cached_result:
             result = cached_result
             cached_count += 1
         else:
-            result = check_file_lint(file_path, lint_step, config.name, cache_manager)
-            cache_manager.update_cache(config.name, lint_step.tool_name, file_path, result)
+            result = check_file_lint(file_path, file_path_str, lint_step, config.name, cache_manager)
+
+            if mtime is not None and cache_manager.enabled and is_cacheable_result(lint_step, result):
+                cache_updates.append(
+                    cache_manager.make_cache_update(config.name, lint_step.tool_name, file_path, mtime, result)
+                )
 
         if result.status == FileStatus.ERROR:
             file_has_errors = True
@@ -536,10 +791,23 @@ def fix_single_file(
         elif result.status == FileStatus.ISSUE:
             file_had_issues = True
             if lint_step.can_fix:
-                fixed = fix_file_lint(file_path, lint_step)
+                if lint_step.package_level:
+                    fixed = run_package_level_fix(lint_step, config.name, cache_manager)
+                else:
+                    fixed = fix_file_lint(file_path_str, lint_step)
                 if fixed:
-                    ok_result = FileResult(file_path, FileStatus.OK, None)
-                    cache_manager.update_cache(config.name, lint_step.tool_name, file_path, ok_result)
+                    if cache_manager.enabled:
+                        try:
+                            fixed_mtime = file_path.stat().st_mtime
+                        except OSError:
+                            pass
+                        else:
+                            ok_result = FileResult(file_path, FileStatus.OK, None)
+                            cache_updates.append(
+                                cache_manager.make_cache_update(
+                                    config.name, lint_step.tool_name, file_path, fixed_mtime, ok_result
+                                )
+                            )
                 else:
                     all_fixed = False
                     if result.error:
@@ -549,6 +817,8 @@ def fix_single_file(
                 if result.error:
                     error_messages.append(f"[{lint_step.tool_name}]\n{result.error}")
 
+    cache_manager.update_cache_bulk(cache_updates)
+
     if file_has_errors:
         outcome = "error"
     elif not file_had_issues:
@@ -586,35 +856,77 @@ def fix_files_parallel(
     stats: Statistics,
     cache_manager: LintCacheManager,
 ) -> None:
+    cached_files, files, file_stats = fast_path_all_cached(files, config, cache_manager)
+    for _ in cached_files:
+        stats.total += 1
+        stats.record_fix(False)
+
+    if not files:
+        return
+
+    files = sort_by_size_descending(files, file_stats)
+
+    for lint_step in config.lint_steps:
+        if lint_step.package_level:
+            run_package_level_lint(files, lint_step, config.name, cache_manager)
+
     output_lock = threading.Lock()
 
-    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(files))) as executor:
         future_to_file = {
-            executor.submit(fix_single_file, file_path, config, cache_manager, output_lock): file_path
+            executor.submit(
+                fix_single_file, file_path, config, cache_manager, output_lock, get_mtime(file_stats, file_path)
+            ): file_path
             for file_path in files
         }
 
-        for future in as_completed(future_to_file):
-            file_path = future_to_file[future]
-            try:
-                outcome, error_messages = future.result()
-
-                stats.increment_total_threadsafe()
+        try:
+            for future in as_completed(future_to_file):
+                file_path = future_to_file[future]
+                try:
+                    outcome, error_messages = future.result()
+
+                    stats.increment_total_threadsafe()
+
+                    if outcome == "error":
+                        stats.increment_errors_threadsafe()
+                    elif outcome == "skip":
+                        stats.record_fix_threadsafe(False)
+                    elif outcome == "fixed":
+                        stats.record_fix_threadsafe(True)
+                    else:
+                        stats.record_fix_threadsafe(False)
 
-                if outcome == "error":
+                except Exception as e:
+                    with output_lock:
+                        print_status("[ERROR]", "yellow", file_path, str(e))
+                    stats.increment_total_threadsafe()
                     stats.increment_errors_threadsafe()
-                elif outcome == "skip":
-                    stats.record_fix_threadsafe(False)
-                elif outcome == "fixed":
-                    stats.record_fix_threadsafe(True)
-                else:
-                    stats.record_fix_threadsafe(False)
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
-            except Exception as e:
-                with output_lock:
-                    print_status("[ERROR]", "yellow", file_path, str(e))
-                stats.increment_total_threadsafe()
-                stats.increment_errors_threadsafe()
+
+def ensure_tools_available(configs: list[LintLanguageConfig]) -> None:
+    tool_names: list[str] = []
+    for config in configs:
+        for lint_step in config.lint_steps:
+            if lint_step.tool_name not in tool_names:
+                tool_names.append(lint_step.tool_name)
+
+    with ThreadPoolExecutor(max_workers=len(tool_names) or 1) as executor:
+        availability = list(executor.map(check_tool_available, tool_names))
+
+    for tool_name, available in zip(tool_names, availability, strict=True):
+        if not available:
+            typer.echo(
+                typer.style(
+                    f"\nError: {tool_name} is not available. Please ensure it is installed.",
+                    fg="red",
+                    bold=True,
+                )
+            )
+            sys.exit(1)
 
 
 @lint.command()  # type: ignore[misc]
@@ -624,29 +936,22 @@ def check(no_cache: bool = typer.Option(False, "--no-cache", help="Disable cachi
 
     cache_manager = LintCacheManager(Files.devutils_lint_cache_file, enabled=not no_cache)
 
-    for config in configs:
-        for lint_step in config.lint_steps:
-            if not check_tool_available(lint_step.tool_name):
-                typer.echo(
-                    typer.style(
-                        f"\nError: {lint_step.tool_name} is not available. Please ensure it is installed.",
-                        fg="red",
-                        bold=True,
-                    )
-                )
-                sys.exit(1)
+    ensure_tools_available(configs)
 
-    for config in configs:
-        files = config.collect_files()
-        if files:
-            typer.echo(typer.style(f"\nLinting {config.name} files...", fg="cyan", bold=True))
-            check_files_parallel(files, config, stats, cache_manager)
-
-    cache_manager.save_cache()
+    cache_manager.start_autosave()
+    try:
+        for config in configs:
+            files = config.collect_files()
+            if files:
+                typer.echo(typer.style(f"\nLinting {config.name} files...", fg="cyan", bold=True))
+                check_files_parallel(files, config, stats, cache_manager)
+    finally:
+        cache_manager.stop_autosave()
+        cache_manager.save_cache()
 
     stats.print_summary("check")
 
-    if stats.has_failures():
+    if stats.has_failures:
         typer.echo(
             typer.style(
                 "\nSome files have linting issues.",
@@ -668,25 +973,18 @@ def fix(no_cache: bool = typer.Option(False, "--no-cache", help="Disable caching
 
     cache_manager = LintCacheManager(Files.devutils_lint_cache_file, enabled=not no_cache)
 
-    for config in configs:
-        for lint_step in config.lint_steps:
-            if not check_tool_available(lint_step.tool_name):
-                typer.echo(
-                    typer.style(
-                        f"\nError: {lint_step.tool_name} is not available. Please ensure it is installed.",
-                        fg="red",
-                        bold=True,
-                    )
-                )
-                sys.exit(1)
-
-    for config in configs:
-        files = config.collect_files()
-        if files:
-            typer.echo(typer.style(f"\nLinting {config.name} files...", fg="cyan", bold=True))
-            fix_files_parallel(files, config, stats, cache_manager)
+    ensure_tools_available(configs)
 
-    cache_manager.save_cache()
+    cache_manager.start_autosave()
+    try:
+        for config in configs:
+            files = config.collect_files()
+            if files:
+                typer.echo(typer.style(f"\nLinting {config.name} files...", fg="cyan", bold=True))
+                fix_files_parallel(files, config, stats, cache_manager)
+    finally:
+        cache_manager.stop_autosave()
+        cache_manager.save_cache()
 
     stats.print_summary("fix")
 
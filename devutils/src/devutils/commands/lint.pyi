@@ -1,9 +1,12 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+import functools
+import os
 import pathlib
+import re
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypedDict
 
 import typer
@@ -26,33 +29,68 @@ from devutils.utils.file_checking import (
 from devutils.utils.file_checking import (
     format_file_path as format_file_path,
 )
+from devutils.utils.file_checking import (
+    format_file_paths as format_file_paths,
+)
 from devutils.utils.file_checking import (
     print_status as print_status,
 )
 
 lint: typer.Typer
-
-class CacheEntry(TypedDict):
-    mtime: float
-    status: str
-    error: str | None
+CACHE_VERSION: str
+CACHE_SHARD_COUNT: int
+CACHE_AUTOSAVE_INTERVAL: float
+LINT_OUTPUT_LIMIT: int
+LINT_PACKAGE_OUTPUT_LIMIT: int
+LINT_OUTPUT_TRUNCATED: bytes
+LINT_SCAN_OVERLAP: int
+LINT_ERROR_PATTERN: re.Pattern[bytes]
+LINT_WARNING_PATTERN: re.Pattern[bytes]
+LINT_CRASH_PATTERN: re.Pattern[bytes]
+CacheKey = tuple[str, str, str]
+CacheEntry = tuple[float, str, str | None]
 
 class CacheData(TypedDict):
     version: str
-    cache: dict[str, CacheEntry]
+    config_hash: str
+    keys: list[list[str]]
+    mtimes: list[float]
+    statuses: list[str]
+    errors: list[str | None]
+
+def get_config_hash() -> str: ...
 
 class LintCacheManager:
     cache_path: pathlib.Path
     enabled: bool
-    cache_data: CacheData
+    config_hash: str
+    cache_shards: list[tuple[dict[CacheKey, CacheEntry], threading.Lock]]
     lock: threading.Lock
     package_level_results: dict[str, dict[pathlib.Path, FileResult]]
+    fix_lock: threading.Lock
+    package_level_fixes: dict[str, bool]
+    save_lock: threading.Lock
+    autosave_stop: threading.Event
+    autosave_thread: threading.Thread | None
     def __init__(self, cache_path: pathlib.Path, enabled: bool = True) -> None: ...
     def load_cache(self) -> None: ...
     def save_cache(self) -> None: ...
-    def get_cache_key(self, language: str, tool_name: str, file_path: pathlib.Path) -> str: ...
-    def get_cached_result(self, language: str, tool_name: str, file_path: pathlib.Path) -> FileResult | None: ...
-    def update_cache(self, language: str, tool_name: str, file_path: pathlib.Path, result: FileResult) -> None: ...
+    def start_autosave(self) -> None: ...
+    def autosave_loop(self) -> None: ...
+    def stop_autosave(self) -> None: ...
+    def get_cache_key(self, language: str, tool_name: str, file_path: pathlib.Path) -> CacheKey: ...
+    def get_cache_shard_index(self, cache_key: CacheKey) -> int: ...
+    def get_cache_shard(self, cache_key: CacheKey) -> tuple[dict[CacheKey, CacheEntry], threading.Lock]: ...
+    def get_cached_result(
+        self, language: str, tool_name: str, file_path: pathlib.Path, current_mtime: float | None = None
+    ) -> FileResult | None: ...
+    def is_cached_ok(
+        self, language: str, tool_names: list[str], file_path: pathlib.Path, current_mtime: float
+    ) -> bool: ...
+    def make_cache_update(
+        self, language: str, tool_name: str, file_path: pathlib.Path, mtime: float, result: FileResult
+    ) -> tuple[CacheKey, CacheEntry]: ...
+    def update_cache_bulk(self, updates: list[tuple[CacheKey, CacheEntry]]) -> None: ...
     def get_package_result(self, cache_key: str, file_path: pathlib.Path) -> FileResult | None: ...
     def set_package_results(self, cache_key: str, results: dict[pathlib.Path, FileResult]) -> None: ...
 
@@ -63,31 +101,66 @@ class LintStep:
     fix_args: list[str]
     can_fix: bool = ...
     package_level: bool = ...
+    check_argv_prefix: list[str] = field(init=False)
+    fix_argv_prefix: list[str] = field(init=False)
+    def __post_init__(self) -> None: ...
 
 @dataclass
 class LintLanguageConfig(LanguageConfig):
     lint_steps: list[LintStep]
 
 def get_language_configs() -> list[LintLanguageConfig]: ...
+@functools.cache
 def check_tool_available(tool_name: str) -> bool: ...
+
+@dataclass
+class CappedOutput:
+    returncode: int
+    output: bytes
+    truncated: bool = ...
+    has_error: bool = ...
+    has_warning: bool = ...
+    has_crash: bool = ...
+    def scan(self, chunk: bytes) -> None: ...
+
+def run_capped(cmd: list[str], limit: int) -> CappedOutput: ...
+def decode_output(output: bytes) -> str: ...
 def run_package_level_lint(
     files: list[pathlib.Path], lint_step: LintStep, config_name: str, cache_manager: LintCacheManager
 ) -> None: ...
+def is_cacheable_result(lint_step: LintStep, result: FileResult) -> bool: ...
 def check_file_lint(
-    file_path: pathlib.Path, lint_step: LintStep, config_name: str, cache_manager: LintCacheManager
+    file_path: pathlib.Path, file_path_str: str, lint_step: LintStep, config_name: str, cache_manager: LintCacheManager
 ) -> FileResult: ...
-def fix_file_lint(file_path: pathlib.Path, lint_step: LintStep) -> bool: ...
+def fix_file_lint(file_path_str: str, lint_step: LintStep) -> bool: ...
+def fast_path_all_cached(
+    files: list[pathlib.Path], config: LintLanguageConfig, cache_manager: LintCacheManager
+) -> tuple[list[pathlib.Path], list[pathlib.Path], dict[pathlib.Path, os.stat_result]]: ...
+def get_mtime(file_stats: dict[pathlib.Path, os.stat_result], file_path: pathlib.Path) -> float | None: ...
+def sort_by_size_descending(
+    files: list[pathlib.Path], file_stats: dict[pathlib.Path, os.stat_result]
+) -> list[pathlib.Path]: ...
+def run_package_level_fix(lint_step: LintStep, config_name: str, cache_manager: LintCacheManager) -> bool: ...
 def check_single_file(
-    file_path: pathlib.Path, config: LintLanguageConfig, cache_manager: LintCacheManager, output_lock: threading.Lock
-) -> tuple[FileStatus, list[str]]: ...
+    file_path: pathlib.Path,
+    config: LintLanguageConfig,
+    cache_manager: LintCacheManager,
+    output_lock: threading.Lock,
+    mtime: float | None,
+) -> tuple[FileStatus, list[str], list[tuple[CacheKey, CacheEntry]]]: ...
 def check_files_parallel(
     files: list[pathlib.Path], config: LintLanguageConfig, stats: Statistics, cache_manager: LintCacheManager
 ) -> None: ...
 def fix_single_file(
-    file_path: pathlib.Path, config: LintLanguageConfig, cache_manager: LintCacheManager, output_lock: threading.Lock
+    file_path: pathlib.Path,
+    config: LintLanguageConfig,
+    cache_manager: LintCacheManager,
+    output_lock: threading.Lock,
+    mtime: float | None,
 ) -> tuple[str, list[str]]: ...
 def fix_files_parallel(
     files: list[pathlib.Path], config: LintLanguageConfig, stats: Statistics, cache_manager: LintCacheManager
 ) -> None: ...
+def ensure_tools_available(configs: list[LintLanguageConfig]) -> None: ...
 def check(no_cache: bool = ...) -> None: ...
 def fix(no_cache: bool = ...) -> None: ...
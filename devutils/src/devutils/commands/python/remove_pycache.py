@@ -2,9 +2,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import os
+import pathlib
 import shutil
 import stat
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import typer
 
@@ -19,13 +21,18 @@ def handle_remove_readonly(func: Callable[[str], object], path: str, exc: BaseEx
     return func(path)
 
 
+def remove_directory(path: pathlib.Path) -> pathlib.Path:
+    shutil.rmtree(path, onexc=handle_remove_readonly)
+    return path
+
+
 @remove_pycache.command()  # type: ignore[misc]
 def run() -> None:
     typer.echo("Removing __pycache__ directories...")
     pycaches = find_directories_by_name(Directories.devutils_root, "__pycache__")
-    for pycache in pycaches:
-        typer.echo(f"Removing {pycache}...")
-        shutil.rmtree(pycache, onexc=handle_remove_readonly)
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+        for path in executor.map(remove_directory, pycaches):
+            typer.echo(f"Removed {path}")
 
     typer.echo("Done!")
 
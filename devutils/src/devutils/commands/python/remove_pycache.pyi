@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+import pathlib
 from collections.abc import Callable as Callable
 
 import typer
@@ -11,5 +12,6 @@ from devutils.utils.filesystem import find_directories_by_name as find_directori
 remove_pycache: typer.Typer
 
 def handle_remove_readonly(func: Callable[[str], object], path: str, exc: BaseException) -> object: ...
+def remove_directory(path: pathlib.Path) -> pathlib.Path: ...
 def run() -> None: ...
 def main(ctx: typer.Context) -> None: ...
@@ -1,16 +1,19 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-import filecmp
+import hashlib
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 
 from devutils.constants.paths import Directories
 
+STUB_COPY_WORKERS = 16
+
 stubgen: typer.Typer = typer.Typer()
 
 
@@ -27,6 +30,31 @@ def check_stubgen_available() -> bool:
         return False
 
 
+def file_digest(path: Path) -> bytes:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+
+
+def find_out_of_date_stubs(existing_dir: Path, fresh_dir: Path, rel_paths: set[Path]) -> list[Path]:
+    out_of_date: list[Path] = []
+    same_size: list[Path] = []
+
+    for rel_path in rel_paths:
+        if (existing_dir / rel_path).stat().st_size != (fresh_dir / rel_path).stat().st_size:
+            out_of_date.append(rel_path)
+        else:
+            same_size.append(rel_path)
+
+    def digests_differ(rel_path: Path) -> bool:
+        return file_digest(existing_dir / rel_path) != file_digest(fresh_dir / rel_path)
+
+    with ThreadPoolExecutor() as executor:
+        for rel_path, differs in zip(same_size, executor.map(digests_differ, same_size), strict=True):
+            if differs:
+                out_of_date.append(rel_path)
+
+    return out_of_date
+
+
 @stubgen.command()  # type: ignore[misc]
 def generate(
     verbose: bool = typer.Option(
@@ -72,17 +100,22 @@ def generate(
             typer.echo(f"{typer.style('[FAIL]', fg='red')} No stub files generated", err=True)
             raise typer.Exit(1)
 
-        copied_count = 0
-        for stub_file in stub_files:
-            relative_path = stub_file.relative_to(temp_stub_dir)
-            target_path = source_dir / relative_path
+        relative_paths = [stub_file.relative_to(temp_stub_dir) for stub_file in stub_files]
 
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(stub_file, target_path)
-            copied_count += 1
+        for target_dir in {(source_dir / relative_path).parent for relative_path in relative_paths}:
+            target_dir.mkdir(parents=True, exist_ok=True)
 
-            if verbose:
-                typer.echo(f"  Copied: {relative_path}")
+        def copy_stub(relative_path: Path) -> Path:
+            shutil.copy2(temp_stub_dir / relative_path, source_dir / relative_path)
+            return relative_path
+
+        copied_count = 0
+        with ThreadPoolExecutor(max_workers=STUB_COPY_WORKERS) as executor:
+            for relative_path in executor.map(copy_stub, relative_paths):
+                copied_count += 1
+
+                if verbose:
+                    typer.echo(f"  Copied: {relative_path}")
 
         typer.echo(
             f"{typer.style('[SUCCESS]', fg='green')} Generated {copied_count} stub file(s) inline with source code"
@@ -111,8 +144,8 @@ def check(
         typer.echo(f"{typer.style('[FAIL]', fg='red')} Source directory does not exist: {source_dir}", err=True)
         raise typer.Exit(1)
 
-    existing_stubs = list(source_dir.rglob("*.pyi"))
-    if not existing_stubs:
+    existing_stub_set = {f.relative_to(source_dir) for f in source_dir.rglob("*.pyi")}
+    if not existing_stub_set:
         typer.echo(f"{typer.style('[FAIL]', fg='red')} No stub files found in source directory", err=True)
         typer.echo("Run 'devutils python stubgen generate' to generate stubs")
         raise typer.Exit(1)
@@ -133,12 +166,9 @@ def check(
             typer.echo(f"{typer.style('[FAIL]', fg='red')} Generated stub directory not found", err=True)
             raise typer.Exit(1)
 
-        fresh_stubs = list(temp_stub_dir.rglob("*.pyi"))
+        fresh_stub_set = {f.relative_to(temp_stub_dir) for f in temp_stub_dir.rglob("*.pyi")}
         differences = []
 
-        existing_stub_set = {f.relative_to(source_dir) for f in existing_stubs}
-        fresh_stub_set = {f.relative_to(temp_stub_dir) for f in fresh_stubs}
-
         missing_stubs = fresh_stub_set - existing_stub_set
         extra_stubs = existing_stub_set - fresh_stub_set
 
@@ -148,11 +178,8 @@ def check(
         for rel_path in extra_stubs:
             differences.append(f"  Extra: {rel_path}")
 
-        for rel_path in existing_stub_set & fresh_stub_set:
-            existing_file = source_dir / rel_path
-            fresh_file = temp_stub_dir / rel_path
-            if not filecmp.cmp(existing_file, fresh_file, shallow=False):
-                differences.append(f"  Out of date: {rel_path}")
+        for rel_path in find_out_of_date_stubs(source_dir, temp_stub_dir, existing_stub_set & fresh_stub_set):
+            differences.append(f"  Out of date: {rel_path}")
 
         if differences:
             typer.echo(f"{typer.style('[FAIL]', fg='red')} Stub files are not up to date:", err=True)
@@ -161,4 +188,4 @@ def check(
             typer.echo("\nRun 'devutils python stubgen generate' to update stubs")
             raise typer.Exit(1)
 
-        typer.echo(f"{typer.style('[SUCCESS]', fg='green')} All {len(existing_stubs)} stub file(s) are up to date")
+        typer.echo(f"{typer.style('[SUCCESS]', fg='green')} All {len(existing_stub_set)} stub file(s) are up to date")
@@ -1,12 +1,17 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+from pathlib import Path
+
 import typer
 
 from devutils.constants.paths import Directories as Directories
 
+STUB_COPY_WORKERS: int
 stubgen: typer.Typer
 
 def check_stubgen_available() -> bool: ...
+def file_digest(path: Path) -> bytes: ...
+def find_out_of_date_stubs(existing_dir: Path, fresh_dir: Path, rel_paths: set[Path]) -> list[Path]: ...
 def generate(verbose: bool = ...) -> None: ...
 def check(verbose: bool = ...) -> None: ...
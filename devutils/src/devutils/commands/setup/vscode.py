@@ -1,31 +1,13 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+from pathlib import Path
+
 import typer
 
 from devutils.constants.paths import ConfigFiles, SettingsFiles
 
-vscode: typer.Typer = typer.Typer()
-
-
-@vscode.command()  # type: ignore[misc]
-def settings(regenerate: bool = typer.Option(False, "--regenerate", "-r", help="Regenerate the settings file")) -> None:
-    if SettingsFiles.vscode_settings.exists():
-        if regenerate:
-            typer.echo(f"Removing settings file: {SettingsFiles.vscode_settings}")
-            SettingsFiles.vscode_settings.unlink()
-        else:
-            typer.echo(f"Settings file already exists: {SettingsFiles.vscode_settings}")
-            raise typer.Exit(0)
-
-    if not SettingsFiles.vscode_settings.parent.exists():
-        typer.echo(f"Creating directory: {SettingsFiles.vscode_settings.parent}")
-        SettingsFiles.vscode_settings.parent.mkdir(parents=True)
-
-    typer.echo(f"Creating settings file: {SettingsFiles.vscode_settings}")
-    with open(SettingsFiles.vscode_settings, "w") as f:
-        f.write(
-            """{
+_SETTINGS_JSON: bytes = b"""{
   "yaml.schemas": {
     "devutils/data/schemas/r2/config.schema.json": [
       "config.yaml"
@@ -35,28 +17,8 @@ def settings(regenerate: bool = typer.Option(False, "--regenerate", "-r", help="
     ]
   }
 }"""
-        )
-
 
-@vscode.command()  # type: ignore[misc]
-def bookmarks(
-    regenerate: bool = typer.Option(False, "--regenerate", "-r", help="Regenerate the bookmarks file"),
-) -> None:
-    if ConfigFiles.vscode_bookmarks.exists():
-        if regenerate:
-            typer.echo(f"Removing bookmarks file: {ConfigFiles.vscode_bookmarks}")
-            ConfigFiles.vscode_bookmarks.unlink()
-        else:
-            typer.echo(f"Bookmarks file already exists: {ConfigFiles.vscode_bookmarks}")
-            raise typer.Exit(0)
-
-    if not ConfigFiles.vscode_bookmarks.parent.exists():
-        typer.echo(f"Creating directory: {ConfigFiles.vscode_bookmarks.parent}")
-        ConfigFiles.vscode_bookmarks.parent.mkdir(parents=True)
-
-    typer.echo(f"Creating bookmarks file: {ConfigFiles.vscode_bookmarks}")
-    with open(ConfigFiles.vscode_bookmarks, "w") as f:
-        f.write("""{
+_BOOKMARKS_JSON: bytes = b"""{
   "files": [
     {
       "path": "libs/debug/CMakeLists.txt",
@@ -120,4 +82,63 @@ def bookmarks(
     }
   ]
 }
-""")
+"""
+
+vscode: typer.Typer = typer.Typer()
+
+
+def create_parent_directory(path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True)
+    except FileExistsError:
+        return
+    typer.echo(f"Created directory: {path.parent}")
+
+
+def create_file(path: Path, data: bytes) -> bool:
+    try:
+        with open(path, "xb", buffering=0) as f:
+            f.write(data)
+    except FileExistsError:
+        return False
+    return True
+
+
+@vscode.command()  # type: ignore[misc]
+def settings(regenerate: bool = typer.Option(False, "--regenerate", "-r", help="Regenerate the settings file")) -> None:
+    if regenerate:
+        try:
+            SettingsFiles.vscode_settings.unlink()
+        except FileNotFoundError:
+            pass
+        else:
+            typer.echo(f"Removed settings file: {SettingsFiles.vscode_settings}")
+
+    create_parent_directory(SettingsFiles.vscode_settings)
+
+    if not create_file(SettingsFiles.vscode_settings, _SETTINGS_JSON):
+        typer.echo(f"Settings file already exists: {SettingsFiles.vscode_settings}")
+        raise typer.Exit(0)
+
+    typer.echo(f"Created settings file: {SettingsFiles.vscode_settings}")
+
+
+@vscode.command()  # type: ignore[misc]
+def bookmarks(
+    regenerate: bool = typer.Option(False, "--regenerate", "-r", help="Regenerate the bookmarks file"),
+) -> None:
+    if regenerate:
+        try:
+            ConfigFiles.vscode_bookmarks.unlink()
+        except FileNotFoundError:
+            pass
+        else:
+            typer.echo(f"Removed bookmarks file: {ConfigFiles.vscode_bookmarks}")
+
+    create_parent_directory(ConfigFiles.vscode_bookmarks)
+
+    if not create_file(ConfigFiles.vscode_bookmarks, _BOOKMARKS_JSON):
+        typer.echo(f"Bookmarks file already exists: {ConfigFiles.vscode_bookmarks}")
+        raise typer.Exit(0)
+
+    typer.echo(f"Created bookmarks file: {ConfigFiles.vscode_bookmarks}")
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+from pathlib import Path
+
 import typer
 
 from devutils.constants.paths import ConfigFiles as ConfigFiles
@@ -8,5 +10,7 @@ from devutils.constants.paths import SettingsFiles as SettingsFiles
 
 vscode: typer.Typer
 
+def create_parent_directory(path: Path) -> None: ...
+def create_file(path: Path, data: bytes) -> bool: ...
 def settings(regenerate: bool = ...) -> None: ...
 def bookmarks(regenerate: bool = ...) -> None: ...
@@ -5,10 +5,10 @@ from typing import ClassVar
 
 
 class Extensions:
-    c_source: ClassVar[list[str]] = [".c", ".h"]
-    cpp_source: ClassVar[list[str]] = [".cxx", ".hxx"]
-    cmake_source: ClassVar[list[str]] = [".cmake"]
-    python_source: ClassVar[list[str]] = [".py", ".pyi"]
-    powershell_source: ClassVar[list[str]] = [".ps1"]
-    bat_source: ClassVar[list[str]] = [".bat"]
-    bash_source: ClassVar[list[str]] = [".sh"]
+    c_source: ClassVar[tuple[str, ...]] = (".c", ".h")
+    cpp_source: ClassVar[tuple[str, ...]] = (".cxx", ".hxx")
+    cmake_source: ClassVar[tuple[str, ...]] = (".cmake",)
+    python_source: ClassVar[tuple[str, ...]] = (".py", ".pyi")
+    powershell_source: ClassVar[tuple[str, ...]] = (".ps1",)
+    bat_source: ClassVar[tuple[str, ...]] = (".bat",)
+    bash_source: ClassVar[tuple[str, ...]] = (".sh",)
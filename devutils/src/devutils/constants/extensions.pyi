@@ -4,10 +4,10 @@
 from typing import ClassVar
 
 class Extensions:
-    c_source: ClassVar[list[str]]
-    cpp_source: ClassVar[list[str]]
-    cmake_source: ClassVar[list[str]]
-    python_source: ClassVar[list[str]]
-    powershell_source: ClassVar[list[str]]
-    bat_source: ClassVar[list[str]]
-    bash_source: ClassVar[list[str]]
+    c_source: ClassVar[tuple[str, ...]]
+    cpp_source: ClassVar[tuple[str, ...]]
+    cmake_source: ClassVar[tuple[str, ...]]
+    python_source: ClassVar[tuple[str, ...]]
+    powershell_source: ClassVar[tuple[str, ...]]
+    bat_source: ClassVar[tuple[str, ...]]
+    bash_source: ClassVar[tuple[str, ...]]
@@ -1,46 +1,54 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from .comments import Comments
+import functools
 
+from .comments import Comments
 
-def generate_license_header(year: int, comment_style: str) -> list[str]:
-    lines = [
-        f"SPDX-FileCopyrightText: {year} Logenium Authors and Contributors",
-        "SPDX-License-Identifier: BSD-3-Clause",
-    ]
+_STYLES: dict[str, str] = {
+    "c": Comments.c,
+    "cpp": Comments.cpp,
+    "python": Comments.python,
+    "cmake": Comments.cmake,
+    "powershell": Comments.powershell,
+    "bat": Comments.bat,
+    "bash": Comments.bash,
+}
 
-    header: list[str] = []
-    for line in lines:
-        header.append(" ".join([comment_style, line]) + "\n")
-    header.append("\n")
 
-    return header
+@functools.lru_cache(maxsize=128)  # type: ignore[misc]
+def generate_header(lang: str, year: int) -> tuple[str, ...]:
+    comment_style = _STYLES[lang]
+    return (
+        f"{comment_style} SPDX-FileCopyrightText: {year} Logenium Authors and Contributors\n",
+        f"{comment_style} SPDX-License-Identifier: BSD-3-Clause\n",
+        "\n",
+    )
 
 
 def generate_c_header(year: int) -> list[str]:
-    return generate_license_header(year, Comments.c)
+    return list(generate_header("c", year))
 
 
 def generate_cpp_header(year: int) -> list[str]:
-    return generate_license_header(year, Comments.cpp)
+    return list(generate_header("cpp", year))
 
 
 def generate_python_header(year: int) -> list[str]:
-    return generate_license_header(year, Comments.python)
+    return list(generate_header("python", year))
 
 
 def generate_cmake_header(year: int) -> list[str]:
-    return generate_license_header(year, Comments.cmake)
+    return list(generate_header("cmake", year))
 
 
 def generate_powershell_header(year: int) -> list[str]:
-    return generate_license_header(year, Comments.powershell)
+    return list(generate_header("powershell", year))
 
 
 def generate_bat_header(year: int) -> list[str]:
-    return generate_license_header(year, Comments.bat)
+    return list(generate_header("bat", year))
 
 
 def generate_bash_header(year: int) -> list[str]:
-    return generate_license_header(year, Comments.bash)
+    return list(generate_header("bash", year))
@@ -3,7 +3,7 @@
 
 from .comments import Comments as Comments
 
-def generate_license_header(year: int, comment_style: str) -> list[str]: ...
+def generate_header(lang: str, year: int) -> tuple[str, ...]: ...
 def generate_c_header(year: int) -> list[str]: ...
 def generate_cpp_header(year: int) -> list[str]: ...
 def generate_python_header(year: int) -> list[str]: ...
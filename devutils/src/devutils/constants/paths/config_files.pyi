@@ -1,11 +1,10 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
 
-@dataclass(frozen=True)
 class ConfigFiles:
-    config: Path = ...
-    xheader_wayland_codegen: Path = ...
-    vscode_bookmarks: Path = ...
+    config: ClassVar[Path]
+    xheader_wayland_codegen: ClassVar[Path]
+    vscode_bookmarks: ClassVar[Path]
@@ -1,63 +1,68 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from dataclasses import dataclass
+import os
 from pathlib import Path
+from typing import ClassVar
 
-_ROOT_DIR: Path = Path(__file__).parent.parent.parent.parent.parent.parent.resolve()
+_ROOT_DIR: Path = Path(os.path.abspath(__file__)).parents[5]
 _BUILD_DIR: Path = _ROOT_DIR / "build"
 _LIBS_DIR: Path = _ROOT_DIR / "libs"
 _CAHCE_DIR: Path = _ROOT_DIR / ".cache"
 _VSCODE_DIR: Path = _ROOT_DIR / ".vscode"
+_DEVUTILS_DIR: Path = _ROOT_DIR / "devutils"
+_XHEADER_DIR: Path = _LIBS_DIR / "xheader"
+_DEBUG_DIR: Path = _LIBS_DIR / "debug"
+_CORELIB_DIR: Path = _LIBS_DIR / "corelib"
+_LOGGING_DIR: Path = _LIBS_DIR / "logging"
 
 
-@dataclass(frozen=True)
 class Directories:
-    root: Path = _ROOT_DIR
-    build: Path = _BUILD_DIR
-    libs: Path = _LIBS_DIR
-    cache: Path = _CAHCE_DIR
-    vscode: Path = _VSCODE_DIR
-
-    logenium_source: Path = _ROOT_DIR / "src"
-    logenium_include: Path = _ROOT_DIR / "include"
-    logenium_cmake: Path = _ROOT_DIR / "cmake"
-    logenium_tests: Path = _ROOT_DIR / "tests"
-
-    xheader_root: Path = _LIBS_DIR / "xheader"
-    xheader_source: Path = _LIBS_DIR / "xheader" / "src"
-    xheader_include: Path = _LIBS_DIR / "xheader" / "include"
-    xheader_cmake: Path = _LIBS_DIR / "xheader" / "cmake"
-    xheader_tests: Path = _LIBS_DIR / "xheader" / "tests"
-
-    debug_root: Path = _LIBS_DIR / "debug"
-    debug_source: Path = _LIBS_DIR / "debug" / "src"
-    debug_include: Path = _LIBS_DIR / "debug" / "include"
-    debug_cmake: Path = _LIBS_DIR / "debug" / "cmake"
-    debug_tests: Path = _LIBS_DIR / "debug" / "tests"
-    debug_docs: Path = _LIBS_DIR / "debug" / "docs"
-
-    devutils_root: Path = _ROOT_DIR / "devutils"
-    devutils_source: Path = _ROOT_DIR / "devutils" / "src"
-    devutils_cache: Path = _CAHCE_DIR / "devutils"
-
-    corelib_root: Path = _LIBS_DIR / "corelib"
-    corelib_source: Path = _LIBS_DIR / "corelib" / "src"
-    corelib_include: Path = _LIBS_DIR / "corelib" / "include"
-    corelib_cmake: Path = _LIBS_DIR / "corelib" / "cmake"
-    corelib_tests: Path = _LIBS_DIR / "corelib" / "tests"
-    corelib_docs: Path = _LIBS_DIR / "corelib" / "docs"
-
-    logging_root: Path = _LIBS_DIR / "logging"
-    logging_source: Path = _LIBS_DIR / "logging" / "src"
-    logging_include: Path = _LIBS_DIR / "logging" / "include"
-    logging_cmake: Path = _LIBS_DIR / "logging" / "cmake"
-    logging_tests: Path = _LIBS_DIR / "logging" / "tests"
-    logging_docs: Path = _LIBS_DIR / "logging" / "docs"
-
-
-DOCS_DIRS: list[Path] = [
+    root: ClassVar[Path] = _ROOT_DIR
+    build: ClassVar[Path] = _BUILD_DIR
+    libs: ClassVar[Path] = _LIBS_DIR
+    cache: ClassVar[Path] = _CAHCE_DIR
+    vscode: ClassVar[Path] = _VSCODE_DIR
+
+    logenium_source: ClassVar[Path] = _ROOT_DIR / "src"
+    logenium_include: ClassVar[Path] = _ROOT_DIR / "include"
+    logenium_cmake: ClassVar[Path] = _ROOT_DIR / "cmake"
+    logenium_tests: ClassVar[Path] = _ROOT_DIR / "tests"
+
+    xheader_root: ClassVar[Path] = _XHEADER_DIR
+    xheader_source: ClassVar[Path] = _XHEADER_DIR / "src"
+    xheader_include: ClassVar[Path] = _XHEADER_DIR / "include"
+    xheader_cmake: ClassVar[Path] = _XHEADER_DIR / "cmake"
+    xheader_tests: ClassVar[Path] = _XHEADER_DIR / "tests"
+
+    debug_root: ClassVar[Path] = _DEBUG_DIR
+    debug_source: ClassVar[Path] = _DEBUG_DIR / "src"
+    debug_include: ClassVar[Path] = _DEBUG_DIR / "include"
+    debug_cmake: ClassVar[Path] = _DEBUG_DIR / "cmake"
+    debug_tests: ClassVar[Path] = _DEBUG_DIR / "tests"
+    debug_docs: ClassVar[Path] = _DEBUG_DIR / "docs"
+
+    devutils_root: ClassVar[Path] = _DEVUTILS_DIR
+    devutils_source: ClassVar[Path] = _DEVUTILS_DIR / "src"
+    devutils_cache: ClassVar[Path] = _CAHCE_DIR / "devutils"
+
+    corelib_root: ClassVar[Path] = _CORELIB_DIR
+    corelib_source: ClassVar[Path] = _CORELIB_DIR / "src"
+    corelib_include: ClassVar[Path] = _CORELIB_DIR / "include"
+    corelib_cmake: ClassVar[Path] = _CORELIB_DIR / "cmake"
+    corelib_tests: ClassVar[Path] = _CORELIB_DIR / "tests"
+    corelib_docs: ClassVar[Path] = _CORELIB_DIR / "docs"
+
+    logging_root: ClassVar[Path] = _LOGGING_DIR
+    logging_source: ClassVar[Path] = _LOGGING_DIR / "src"
+    logging_include: ClassVar[Path] = _LOGGING_DIR / "include"
+    logging_cmake: ClassVar[Path] = _LOGGING_DIR / "cmake"
+    logging_tests: ClassVar[Path] = _LOGGING_DIR / "tests"
+    logging_docs: ClassVar[Path] = _LOGGING_DIR / "docs"
+
+
+DOCS_DIRS: tuple[Path, ...] = (
     Directories.corelib_docs,
     Directories.debug_docs,
     Directories.logging_docs,
-]
+)
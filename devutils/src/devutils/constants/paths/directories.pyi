@@ -1,45 +1,44 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
 
-@dataclass(frozen=True)
 class Directories:
-    root: Path = ...
-    build: Path = ...
-    libs: Path = ...
-    cache: Path = ...
-    vscode: Path = ...
-    logenium_source: Path = ...
-    logenium_include: Path = ...
-    logenium_cmake: Path = ...
-    logenium_tests: Path = ...
-    xheader_root: Path = ...
-    xheader_source: Path = ...
-    xheader_include: Path = ...
-    xheader_cmake: Path = ...
-    xheader_tests: Path = ...
-    debug_root: Path = ...
-    debug_source: Path = ...
-    debug_include: Path = ...
-    debug_cmake: Path = ...
-    debug_tests: Path = ...
-    debug_docs: Path = ...
-    devutils_root: Path = ...
-    devutils_source: Path = ...
-    devutils_cache: Path = ...
-    corelib_root: Path = ...
-    corelib_source: Path = ...
-    corelib_include: Path = ...
-    corelib_cmake: Path = ...
-    corelib_tests: Path = ...
-    corelib_docs: Path = ...
-    logging_root: Path = ...
-    logging_source: Path = ...
-    logging_include: Path = ...
-    logging_cmake: Path = ...
-    logging_tests: Path = ...
-    logging_docs: Path = ...
+    root: ClassVar[Path]
+    build: ClassVar[Path]
+    libs: ClassVar[Path]
+    cache: ClassVar[Path]
+    vscode: ClassVar[Path]
+    logenium_source: ClassVar[Path]
+    logenium_include: ClassVar[Path]
+    logenium_cmake: ClassVar[Path]
+    logenium_tests: ClassVar[Path]
+    xheader_root: ClassVar[Path]
+    xheader_source: ClassVar[Path]
+    xheader_include: ClassVar[Path]
+    xheader_cmake: ClassVar[Path]
+    xheader_tests: ClassVar[Path]
+    debug_root: ClassVar[Path]
+    debug_source: ClassVar[Path]
+    debug_include: ClassVar[Path]
+    debug_cmake: ClassVar[Path]
+    debug_tests: ClassVar[Path]
+    debug_docs: ClassVar[Path]
+    devutils_root: ClassVar[Path]
+    devutils_source: ClassVar[Path]
+    devutils_cache: ClassVar[Path]
+    corelib_root: ClassVar[Path]
+    corelib_source: ClassVar[Path]
+    corelib_include: ClassVar[Path]
+    corelib_cmake: ClassVar[Path]
+    corelib_tests: ClassVar[Path]
+    corelib_docs: ClassVar[Path]
+    logging_root: ClassVar[Path]
+    logging_source: ClassVar[Path]
+    logging_include: ClassVar[Path]
+    logging_cmake: ClassVar[Path]
+    logging_tests: ClassVar[Path]
+    logging_docs: ClassVar[Path]
 
-DOCS_DIRS: list[Path]
+DOCS_DIRS: tuple[Path, ...]
@@ -1,17 +1,18 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
 
-@dataclass(frozen=True)
 class Files:
-    corelib_doxygen_config: Path = ...
-    devutils_lint_cache_file: Path = ...
-    devutils_license_headers_cache_file: Path = ...
-    devutils_pyproject_toml: Path = ...
-    debug_doxygen_config: Path = ...
-    logging_doxygen_config: Path = ...
-    ninja_build_file: Path = ...
+    clang_tidy_config: ClassVar[Path]
+    compile_commands: ClassVar[Path]
+    corelib_doxygen_config: ClassVar[Path]
+    devutils_lint_cache_file: ClassVar[Path]
+    devutils_license_headers_cache_file: ClassVar[Path]
+    devutils_pyproject_toml: ClassVar[Path]
+    debug_doxygen_config: ClassVar[Path]
+    logging_doxygen_config: ClassVar[Path]
+    ninja_build_file: ClassVar[Path]
 
-DOXYGEN_CONFIGS: dict[str, Path]
+DOXYGEN_CONFIGS: tuple[tuple[str, Path], ...]
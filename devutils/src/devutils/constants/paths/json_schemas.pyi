@@ -1,13 +1,12 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
 
-@dataclass(frozen=True)
 class JsonSchemas:
-    codegen: Path = ...
-    config_r1: Path = ...
-    config_r2: Path = ...
-    config_r3: Path = ...
-    config: Path = ...
+    codegen: ClassVar[Path]
+    config_r1: ClassVar[Path]
+    config_r2: ClassVar[Path]
+    config_r3: ClassVar[Path]
+    config: ClassVar[Path]
@@ -1,12 +1,11 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
 
 from .directories import Directories as _Directories
 
 
-@dataclass
 class SettingsFiles:
-    vscode_settings: Path = _Directories.vscode / "settings.json"
+    vscode_settings: ClassVar[Path] = _Directories.vscode / "settings.json"
@@ -1,9 +1,8 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
 
-@dataclass
 class SettingsFiles:
-    vscode_settings: Path = ...
+    vscode_settings: ClassVar[Path]
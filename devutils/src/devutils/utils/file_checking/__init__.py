@@ -5,7 +5,7 @@ from .file_result import FileResult
 from .file_status import FileStatus
 from .language_config import LanguageConfig
 from .statistics import Statistics
-from .utils import collect_files, format_file_path, print_status
+from .utils import collect_files, format_file_path, format_file_paths, print_status
 
 __all__ = [
     "FileResult",
@@ -14,5 +14,6 @@ __all__ = [
     "Statistics",
     "collect_files",
     "format_file_path",
+    "format_file_paths",
     "print_status",
 ]
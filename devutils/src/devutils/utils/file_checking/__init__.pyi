@@ -5,9 +5,18 @@ from .file_result import FileResult as FileResult
 from .file_status import FileStatus as FileStatus
 from .language_config import LanguageConfig as LanguageConfig
 from .statistics import Statistics as Statistics
-from .utils import collect_files as collect_files
-from .utils import format_file_path as format_file_path
-from .utils import print_status as print_status
+from .utils import (
+    collect_files as collect_files,
+)
+from .utils import (
+    format_file_path as format_file_path,
+)
+from .utils import (
+    format_file_paths as format_file_paths,
+)
+from .utils import (
+    print_status as print_status,
+)
 
 __all__ = [
     "FileResult",
@@ -16,5 +25,6 @@ __all__ = [
     "Statistics",
     "collect_files",
     "format_file_path",
+    "format_file_paths",
     "print_status",
 ]
@@ -1,12 +1,12 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-from enum import Enum
+from enum import IntEnum
 
 
-class FileStatus(Enum):
-    OK = "ok"
-    WARNING = "warning"
-    ISSUE = "issue"
-    ERROR = "error"
-    UNKNOWN = "unknown"
+class FileStatus(IntEnum):
+    OK = 0
+    WARNING = 1
+    ISSUE = 2
+    ERROR = 3
+    UNKNOWN = 4
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import pathlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .utils import collect_files as _collect_files
 
@@ -10,9 +10,12 @@ from .utils import collect_files as _collect_files
 @dataclass
 class LanguageConfig:
     name: str
-    extensions: list[str]
+    extensions: tuple[str, ...]
     search_dirs: list[pathlib.Path]
     specific_files: list[pathlib.Path]
+    _files: list[pathlib.Path] | None = field(default=None, init=False, repr=False, compare=False)
 
     def collect_files(self) -> list[pathlib.Path]:
-        return _collect_files(self.extensions, self.search_dirs, self.specific_files)
+        if self._files is None:
+            self._files = _collect_files(self.extensions, self.search_dirs, self.specific_files)
+        return self._files
@@ -2,15 +2,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import ClassVar, cast
 
 import typer
 
 from .file_result import FileResult
-from .file_status import FileStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Statistics:
     total: int = 0
     ok: int = 0
@@ -20,20 +20,33 @@ class Statistics:
     fixed: int = 0
     skipped: int = 0
     issue_label: str = "[ISSUE]"
+    _lock: threading.Lock = field(init=False, repr=False, compare=False)
+    _has_failures: bool = field(init=False, repr=False, compare=False)
+    _issue_tag: str = field(init=False, repr=False, compare=False)
+
+    status_counters: ClassVar[tuple[str | None, ...]] = ("ok", "warnings", "issues", "errors", None)
+    failure_statuses: ClassVar[tuple[bool, ...]] = (False, False, True, True, False)
+
+    separator: ClassVar[str] = typer.style("=" * 60, fg="cyan")
+    ok_tag: ClassVar[str] = typer.style("[OK]", fg="green")
+    warning_tag: ClassVar[str] = typer.style("[WARNING]", fg="yellow")
+    red_error_tag: ClassVar[str] = typer.style("[ERROR]", fg="red")
+    yellow_error_tag: ClassVar[str] = typer.style("[ERROR]", fg="yellow")
+    fixed_tag: ClassVar[str] = typer.style("[FIXED]", fg="green")
+    skipped_tag: ClassVar[str] = typer.style("[SKIPPED]", fg="cyan")
 
     def __post_init__(self) -> None:
         self._lock = threading.Lock()
+        self._has_failures = False
+        self._issue_tag = typer.style(self.issue_label, fg="red")
 
     def record_result(self, result: FileResult) -> None:
         self.total += 1
-        if result.status == FileStatus.OK:
-            self.ok += 1
-        elif result.status == FileStatus.WARNING:
-            self.warnings += 1
-        elif result.status == FileStatus.ISSUE:
-            self.issues += 1
-        elif result.status == FileStatus.ERROR:
-            self.errors += 1
+        counter = self.status_counters[result.status]
+        if counter is not None:
+            setattr(self, counter, cast(int, getattr(self, counter)) + 1)
+        if self.failure_statuses[result.status]:
+            self._has_failures = True
 
     def record_fix(self, fixed: bool) -> None:
         if fixed:
@@ -42,30 +55,34 @@ class Statistics:
             self.skipped += 1
 
     def print_summary(self, mode: str) -> None:
-        typer.echo("")
-        typer.echo(typer.style("=" * 60, fg="cyan"))
-        typer.echo(typer.style(f"Summary ({mode} mode)", fg="cyan", bold=True))
-        typer.echo(typer.style("=" * 60, fg="cyan"))
-        typer.echo(f"Total files checked: {self.total}")
+        lines = [
+            "",
+            self.separator,
+            typer.style(f"Summary ({mode} mode)", fg="cyan", bold=True),
+            self.separator,
+            f"Total files checked: {self.total}",
+        ]
 
         if mode == "check":
-            typer.echo(f"  {typer.style('[OK]', fg='green')}          {self.ok}")
+            lines.append(f"  {self.ok_tag}          {self.ok}")
             if self.warnings > 0:
-                typer.echo(f"  {typer.style('[WARNING]', fg='yellow')}    {self.warnings}")
+                lines.append(f"  {self.warning_tag}    {self.warnings}")
             if self.issues > 0:
-                typer.echo(f"  {typer.style(self.issue_label, fg='red')} {self.issues}")
+                lines.append(f"  {self._issue_tag} {self.issues}")
             if self.errors > 0:
-                typer.echo(f"  {typer.style('[ERROR]', fg='red')}       {self.errors}")
+                lines.append(f"  {self.red_error_tag}       {self.errors}")
         elif mode == "fix":
-            typer.echo(f"  {typer.style('[FIXED]', fg='green')}    {self.fixed}")
-            typer.echo(f"  {typer.style('[SKIPPED]', fg='cyan')}  {self.skipped}")
+            lines.append(f"  {self.fixed_tag}    {self.fixed}")
+            lines.append(f"  {self.skipped_tag}  {self.skipped}")
             if self.errors > 0:
-                typer.echo(f"  {typer.style('[ERROR]', fg='yellow')}    {self.errors}")
+                lines.append(f"  {self.yellow_error_tag}    {self.errors}")
 
-        typer.echo(typer.style("=" * 60, fg="cyan"))
+        lines.append(self.separator)
+        typer.echo("\n".join(lines))
 
+    @property
     def has_failures(self) -> bool:
-        return self.issues > 0 or self.errors > 0
+        return self._has_failures or self.errors > 0
 
     def record_result_threadsafe(self, result: FileResult) -> None:
         with self._lock:
@@ -2,11 +2,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 from .file_result import FileResult as FileResult
-from .file_status import FileStatus as FileStatus
 
-@dataclass
+@dataclass(slots=True)
 class Statistics:
     total: int = ...
     ok: int = ...
@@ -16,10 +16,20 @@ class Statistics:
     fixed: int = ...
     skipped: int = ...
     issue_label: str = ...
+    status_counters: ClassVar[tuple[str | None, ...]] = ...
+    failure_statuses: ClassVar[tuple[bool, ...]] = ...
+    separator: ClassVar[str] = ...
+    ok_tag: ClassVar[str] = ...
+    warning_tag: ClassVar[str] = ...
+    red_error_tag: ClassVar[str] = ...
+    yellow_error_tag: ClassVar[str] = ...
+    fixed_tag: ClassVar[str] = ...
+    skipped_tag: ClassVar[str] = ...
     def __post_init__(self) -> None: ...
     def record_result(self, result: FileResult) -> None: ...
     def record_fix(self, fixed: bool) -> None: ...
     def print_summary(self, mode: str) -> None: ...
+    @property
     def has_failures(self) -> bool: ...
     def record_result_threadsafe(self, result: FileResult) -> None: ...
     def increment_total_threadsafe(self) -> None: ...
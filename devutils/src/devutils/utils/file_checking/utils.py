@@ -1,36 +1,69 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+import os
 import pathlib
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 import typer
 
 from devutils.constants.paths import Directories
-from devutils.utils.filesystem import find_files_by_extensions
+from devutils.utils.filesystem import PRUNED_DIRECTORIES, iter_files_by_extensions
+
+COLLECT_WORKERS = 8
+
+_ROOT_STR = str(Directories.root) + os.sep
+_ROOT_LEN = len(_ROOT_STR)
 
 
 def collect_files(
-    extensions: list[str],
+    extensions: tuple[str, ...],
     search_dirs: list[pathlib.Path],
     specific_files: list[pathlib.Path],
 ) -> list[pathlib.Path]:
     files: list[pathlib.Path] = []
+    seen: set[str] = set()
 
-    for search_dir in search_dirs:
+    def scan_directory(search_dir: pathlib.Path) -> list[str]:
         if search_dir.exists():
-            files.extend(find_files_by_extensions(search_dir, extensions))
+            return sorted(iter_files_by_extensions(search_dir, extensions, PRUNED_DIRECTORIES))
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(COLLECT_WORKERS, len(search_dirs)) or 1) as executor:
+        for found_files in executor.map(scan_directory, search_dirs):
+            for path_str in found_files:
+                if path_str not in seen:
+                    seen.add(path_str)
+                    files.append(pathlib.Path(path_str))
 
     for specific_file in specific_files:
-        if specific_file.exists():
+        path_str = os.fspath(specific_file)
+        if path_str not in seen and specific_file.exists():
+            seen.add(path_str)
             files.append(specific_file)
 
     return files
 
 
 def format_file_path(file_path: pathlib.Path) -> str:
+    path_str = str(file_path)
+    if path_str.startswith(_ROOT_STR):
+        return path_str[_ROOT_LEN:]
     return str(file_path.relative_to(Directories.root))
 
 
+def format_file_paths(file_paths: Iterable[pathlib.Path]) -> list[str]:
+    formatted_paths: list[str] = []
+    for file_path in file_paths:
+        path_str = os.fspath(file_path)
+        if path_str.startswith(_ROOT_STR):
+            formatted_paths.append(path_str[_ROOT_LEN:])
+        else:
+            formatted_paths.append(str(file_path.relative_to(Directories.root)))
+    return formatted_paths
+
+
 def print_status(status_label: str, color: str, file_path: pathlib.Path, message: str = "") -> None:
     formatted_path = format_file_path(file_path)
     if message:
@@ -2,12 +2,21 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import pathlib
+from collections.abc import Iterable
 
 from devutils.constants.paths import Directories as Directories
-from devutils.utils.filesystem import find_files_by_extensions as find_files_by_extensions
+from devutils.utils.filesystem import (
+    PRUNED_DIRECTORIES as PRUNED_DIRECTORIES,
+)
+from devutils.utils.filesystem import (
+    iter_files_by_extensions as iter_files_by_extensions,
+)
+
+COLLECT_WORKERS: int
 
 def collect_files(
-    extensions: list[str], search_dirs: list[pathlib.Path], specific_files: list[pathlib.Path]
+    extensions: tuple[str, ...], search_dirs: list[pathlib.Path], specific_files: list[pathlib.Path]
 ) -> list[pathlib.Path]: ...
 def format_file_path(file_path: pathlib.Path) -> str: ...
+def format_file_paths(file_paths: Iterable[pathlib.Path]) -> list[str]: ...
 def print_status(status_label: str, color: str, file_path: pathlib.Path, message: str = "") -> None: ...
@@ -1,23 +1,56 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+import os
 import pathlib
+from collections.abc import Iterator, Set
+
+PRUNED_DIRECTORIES: frozenset[str] = frozenset(
+    {".git", ".hg", ".svn", "__pycache__", ".mypy_cache", ".ruff_cache", ".tox"}
+)
+
+
+def _walk(path_str: str, prune: Set[str] | None = None) -> Iterator[os.DirEntry[str]]:
+    pending = [path_str]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if prune is None or entry.name not in prune:
+                            pending.append(entry.path)
+                    yield entry
+        except OSError:
+            continue
 
 
 def find_directories_by_name(path: pathlib.Path, name: str) -> list[pathlib.Path]:
-    return sorted(d for d in path.rglob(name) if d.is_dir())
+    directories = sorted(
+        entry.path for entry in _walk(os.fspath(path)) if entry.name == name and entry.is_dir(follow_symlinks=False)
+    )
+    return [pathlib.Path(directory) for directory in directories]
 
 
 def find_files_by_name(path: pathlib.Path, name: str) -> list[pathlib.Path]:
-    return sorted(f for f in path.rglob(name) if f.is_file())
+    files = sorted(entry.path for entry in _walk(os.fspath(path)) if entry.name == name and entry.is_file())
+    return [pathlib.Path(file) for file in files]
+
+
+def iter_files_by_extensions(
+    path: pathlib.Path, extensions: tuple[str, ...], prune: Set[str] | None = None
+) -> Iterator[str]:
+    for entry in _walk(os.fspath(path), prune):
+        if entry.name.endswith(extensions) and not entry.is_dir(follow_symlinks=False):
+            yield entry.path
 
 
-def find_files_by_extensions(path: pathlib.Path, extensions: list[str]) -> list[pathlib.Path]:
-    files: list[pathlib.Path] = []
-    for extension in extensions:
-        files.extend(path.rglob(f"*{extension}"))
-    return sorted(files)
+def find_files_by_extensions(
+    path: pathlib.Path, extensions: tuple[str, ...], prune: Set[str] | None = None
+) -> list[pathlib.Path]:
+    return [pathlib.Path(file) for file in sorted(iter_files_by_extensions(path, extensions, prune))]
 
 
 def get_files_recursively(path: pathlib.Path) -> list[pathlib.Path]:
-    return sorted(path.rglob("*"))
+    files = sorted(entry.path for entry in _walk(os.fspath(path)))
+    return [pathlib.Path(file) for file in files]
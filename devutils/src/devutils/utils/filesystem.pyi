@@ -2,8 +2,17 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import pathlib
+from collections.abc import Iterator
+from collections.abc import Set as Set
+
+PRUNED_DIRECTORIES: frozenset[str]
 
 def find_directories_by_name(path: pathlib.Path, name: str) -> list[pathlib.Path]: ...
 def find_files_by_name(path: pathlib.Path, name: str) -> list[pathlib.Path]: ...
-def find_files_by_extensions(path: pathlib.Path, extensions: list[str]) -> list[pathlib.Path]: ...
+def iter_files_by_extensions(
+    path: pathlib.Path, extensions: tuple[str, ...], prune: Set[str] | None = None
+) -> Iterator[str]: ...
+def find_files_by_extensions(
+    path: pathlib.Path, extensions: tuple[str, ...], prune: Set[str] | None = None
+) -> list[pathlib.Path]: ...
 def get_files_recursively(path: pathlib.Path) -> list[pathlib.Path]: ...
@@ -1,23 +1,91 @@
 # SPDX-FileCopyrightText: 2025 Logenium Authors and Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
+import functools
 import pathlib
 import subprocess
+import threading
 from datetime import datetime
 
+from devutils.constants.paths import Directories
 
-def get_earliest_git_year(file_path: pathlib.Path) -> int | None:
+_history_years: dict[str, int] = {}
+_history_loaded = False
+_history_lock = threading.Lock()
+
+
+def read_git_history_years() -> dict[str, int]:
+    years: dict[str, int] = {}
     try:
-        result = subprocess.run(
-            ["git", "log", "--follow", "--format=%aI", "--reverse", "--", str(file_path)],
-            capture_output=True,
+        with subprocess.Popen(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--reverse",
+                "--name-only",
+                "--no-renames",
+                "--diff-filter=A",
+                "--format=%x00%aI",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            check=True,
-        )
+            encoding="utf-8",
+            errors="replace",
+            cwd=Directories.root,
+        ) as process:
+            if process.stdout is None:
+                return {}
+            year: int | None = None
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                if line.startswith("\0"):
+                    try:
+                        year = int(line[1:5])
+                    except ValueError:
+                        year = None
+                    continue
+
+                if year is not None and line:
+                    years.setdefault(line, year)
+
+            if process.wait() != 0:
+                return {}
+    except FileNotFoundError:
+        return {}
+
+    return years
+
+
+def ensure_copyright_years_loaded() -> None:
+    global _history_years, _history_loaded
+    if _history_loaded:
+        return
+    with _history_lock:
+        if not _history_loaded:
+            _history_years = read_git_history_years()
+            _history_loaded = True
+
+
+def get_git_relative_path(file_path: pathlib.Path) -> str | None:
+    try:
+        return file_path.relative_to(Directories.root).as_posix()
+    except ValueError:
+        return None
+
+
+def get_earliest_git_year(file_path: pathlib.Path) -> int | None:
+    return _get_earliest_git_year_cached(str(file_path))
+
 
-        if result.stdout.strip():
-            first_commit_date = result.stdout.strip().split("\n")[0]
-            return datetime.fromisoformat(first_commit_date).year
+@functools.cache  # type: ignore[misc]
+def _get_earliest_git_year_cached(path_str: str) -> int | None:
+    try:
+        added_dates = git_log_dates(["--diff-filter=A", "--", path_str])
+        if added_dates:
+            return int(added_dates[-1][:4])
 
         return None
 
@@ -25,15 +93,34 @@ def get_earliest_git_year(file_path: pathlib.Path) -> int | None:
         return None
 
 
+def git_log_dates(args: list[str]) -> list[str]:
+    result = subprocess.run(
+        ["git", "log", "--format=%aI", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def get_known_git_year(file_path: pathlib.Path) -> int | None:
+    ensure_copyright_years_loaded()
+
+    relative_path = get_git_relative_path(file_path)
+    if relative_path is not None:
+        year = _history_years.get(relative_path)
+        if year is not None:
+            return year
+    return get_earliest_git_year(file_path)
+
+
 def get_file_copyright_year(file_path: pathlib.Path) -> int:
     if file_path.suffix == ".pyi":
-        py_file = file_path.with_suffix(".py")
-        if py_file.exists():
-            year = get_earliest_git_year(py_file)
-            if year is not None:
-                return year
+        year = get_known_git_year(file_path.with_suffix(".py"))
+        if year is not None:
+            return year
 
-    year = get_earliest_git_year(file_path)
+    year = get_known_git_year(file_path)
     if year is not None:
         return year
 
@@ -3,5 +3,12 @@
 
 import pathlib
 
+from devutils.constants.paths import Directories as Directories
+
+def read_git_history_years() -> dict[str, int]: ...
+def ensure_copyright_years_loaded() -> None: ...
+def get_git_relative_path(file_path: pathlib.Path) -> str | None: ...
 def get_earliest_git_year(file_path: pathlib.Path) -> int | None: ...
+def git_log_dates(args: list[str]) -> list[str]: ...
+def get_known_git_year(file_path: pathlib.Path) -> int | None: ...
 def get_file_copyright_year(file_path: pathlib.Path) -> int: ...